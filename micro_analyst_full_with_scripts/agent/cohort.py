@@ -20,7 +20,7 @@ from core.cohort_schemas import (
     CohortResultsResponse,
 )
 from utils.cohort_discovery import discover_cohort, extract_domain
-from utils.persistence import save_cohort, get_cohort, update_cohort_status
+from utils.persistence import save_cohort, save_cohort_with_jobs, get_cohort, update_cohort_status
 from utils.cohort_drift import analyze_cohort_drift
 from utils.cohort_synthesis import generate_cohort_report_markdown
 
@@ -139,6 +139,10 @@ def confirm_cohort(
 # Cohort Analysis (Fan-out)
 # ---------------------------------------------------------------------------
 
+# Focus every fanned-out single-URL analysis runs with
+COHORT_ANALYSIS_FOCUS = "SaaS cohort analysis"
+
+
 def start_cohort_analysis(
     cohort_id: str,
     analyze_fn,  # Callable that creates analysis jobs
@@ -147,7 +151,10 @@ def start_cohort_analysis(
     """
     Start analysis for all confirmed targets.
     
-    Uses the existing single-URL analysis pipeline.
+    Uses the existing single-URL analysis pipeline. analyze_fn(url, api_key)
+    must start a job with COHORT_ANALYSIS_FOCUS; the queued job rows record
+    that focus, and company_name is filled in by the job's own saves once
+    the pipeline resolves it.
     """
     cohort = get_cohort(cohort_id)
     if not cohort:
@@ -162,22 +169,35 @@ def start_cohort_analysis(
     
     # Fan out to existing analyze endpoint
     job_ids = []
+    job_rows = []
     for url in confirmed_urls:
         try:
             job_id = analyze_fn(url, api_key)
             job_ids.append(job_id)
+            job_rows.append({
+                "id": job_id,
+                "status": "queued",
+                "progress": 0,
+                "company_url": url,
+                "company_name": None,
+                "focus": COHORT_ANALYSIS_FOCUS,
+                "api_key": api_key,
+            })
             logger.info(f"[Cohort {cohort_id}] Started job {job_id} for {url}")
         except Exception as e:
             logger.error(f"[Cohort {cohort_id}] Failed to start job for {url}: {e}")
     
-    # Update cohort with job IDs
-    save_cohort(
-        cohort_id=cohort_id,
-        anchor_url=cohort["anchor_url"],
-        category_hint=cohort["category_hint"],
-        status="analyzing",
-        job_ids=job_ids,
-        api_key=api_key
+    # Update cohort with job IDs and record the queued jobs in one transaction
+    save_cohort_with_jobs(
+        {
+            "cohort_id": cohort_id,
+            "anchor_url": cohort["anchor_url"],
+            "category_hint": cohort["category_hint"],
+            "status": "analyzing",
+            "job_ids": job_ids,
+            "api_key": api_key,
+        },
+        job_rows,
     )
     
     return CohortAnalyzeResponse(
@@ -21,6 +21,7 @@ from core.cohort_schemas import (
     CohortDriftResponse,
 )
 from agent.cohort import (
+    COHORT_ANALYSIS_FOCUS,
     propose_cohort,
     confirm_cohort,
     start_cohort_analysis,
@@ -137,7 +138,7 @@ def cohort_analyze(
         req = AnalyzeRequest(
             company_url=url,
             company_name=None,
-            focus="SaaS cohort analysis"
+            focus=COHORT_ANALYSIS_FOCUS
         )
         
         # Generate job ID
@@ -152,7 +153,7 @@ def cohort_analyze(
             "progress": 0,
             "company_url": url,
             "company_name": None,
-            "focus": "SaaS cohort analysis",
+            "focus": COHORT_ANALYSIS_FOCUS,
             "api_key": api_key,
             "result": None,
             "error": None,
@@ -33,10 +33,11 @@ from core.merge_profiles import (
 from utils.llm_client import LLMClient, get_llm_client
 from agent.web_surfaces import fetch_web_surfaces, aggregate_web_surfaces
 from utils.persistence import (
-    init_db, save_report, get_report, increment_usage, markdown_to_pdf,
-    check_quota, save_job, get_job_db, load_pending_jobs, DAILY_QUOTA_PER_KEY,
-    get_latest_reports
+    init_db, save_report, get_report, increment_usage, markdown_to_pdf_async,
+    check_quota, save_job, save_jobs_bulk, get_job_db, load_pending_jobs, DAILY_QUOTA_PER_KEY,
+    get_latest_reports, get_db_metrics, start_snapshot_thread
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
 
 # ---------------------------------------------------------------------------
@@ -49,8 +50,8 @@ ENV_PATH = os.path.join(BASE_DIR, ".env")
 
 load_dotenv(ENV_PATH)
 
-logger.info(
-    "LLM ENV DEBUG: USE_GEMINI_LLM=%r, GOOGLE_API_KEY_SET=%r",
+logger.debug(
+    "LLM ENV: USE_GEMINI_LLM={!r}, GOOGLE_API_KEY_SET={}",
     os.getenv("USE_GEMINI_LLM"),
     bool(os.getenv("GOOGLE_API_KEY")),
 )
@@ -121,34 +122,27 @@ def startup_event():
     - Populates in-memory jobs dict for continuity.
     """
     logger.info("Startup: Recovering pending jobs from database...")
-    pending = load_pending_jobs()
-    
     count_recovered = 0
-    count_failed = 0
+    interrupted = []
     
-    for jid, job in pending.items():
+    for job in load_pending_jobs():
+        jid = job.pop("id")
         # If job was running when server died, it's now failed
         if job["status"] == "running":
             job["status"] = "failed"
             job["error"] = "Job interrupted by server restart."
-            # Update DB to reflect failure
-            save_job(
-                job_id=jid,
-                status="failed",
-                progress=job["progress"],
-                company_url=job["company_url"],
-                company_name=job["company_name"],
-                focus=job["focus"],
-                api_key=job["api_key"],
-                error=job["error"]
-            )
-            count_failed += 1
+            interrupted.append({"id": jid, **job})
         
         # Load into memory so clients can still poll them
         jobs[jid] = job
         count_recovered += 1
+
+    # Update DB to reflect failures in one batched write
+    save_jobs_bulk(interrupted)
+    count_failed = len(interrupted)
         
     logger.info(f"Recovery complete: {count_recovered} jobs loaded ({count_failed} marked as interrupted).")
+    start_snapshot_thread()
     logger.info("Backend ready at http://localhost:8000 — /health, /docs, /analyze available.")
 
 
@@ -160,6 +154,12 @@ def health_check():
     """
     return {"status": "ok", "service": "signal-analyst", "port": 8000}
 
+
+@app.get("/health/db")
+def health_db():
+    """SQLite persistence latency percentiles and connection-pool sizes."""
+    return get_db_metrics()
+
 # ---------------------------------------------------------------------------
 # MCP endpoint URLs (used by tests via micro_analyst.MCP_... constants)
 # ---------------------------------------------------------------------------
@@ -460,7 +460,7 @@ def _run_analysis_task(job_id: str, req: AnalyzeRequest, api_key: str) -> None:
                     web_scrape_endpoint=MCP_WEB_SCRAPE_URL,
                     post_json_fn=_post_json,
                 )
-                logger.info(f"[Job {job_id}] Web surfaces scraped: %d", len(surfaces))
+                logger.info("[Job {}] Web surfaces scraped: {}", job_id, len(surfaces))
                 web_result = aggregate_web_surfaces(req.company_url, surfaces)
                 profile = merge_web_data(profile, web_result)
             except Exception as e:
@@ -503,7 +503,8 @@ def _run_analysis_task(job_id: str, req: AnalyzeRequest, api_key: str) -> None:
             logger.error(f"[Job {job_id}] Error extracting web text/meta: {e}")
 
         logger.info(
-            f"[Job {job_id}] Web surface summary: text_len=%d, title=%r",
+            "[Job {}] Web surface summary: text_len={}, title={!r}",
+            job_id,
             len(web_text or ""),
             web_meta.get("title"),
         )
@@ -848,7 +849,7 @@ def analyze(req: AnalyzeRequest, api_key: str = Header(None, alias="X-API-Key"))
                 web_scrape_endpoint=MCP_WEB_SCRAPE_URL,
                 post_json_fn=_post_json,
             )
-            logger.info(f"[Job {job_id}] Web surfaces scraped: %d", len(surfaces))
+            logger.info("[Job {}] Web surfaces scraped: {}", job_id, len(surfaces))
             web_result = aggregate_web_surfaces(req.company_url, surfaces)
             profile = merge_web_data(profile, web_result)
         except Exception as e:
@@ -986,7 +987,7 @@ def analyze(req: AnalyzeRequest, api_key: str = Header(None, alias="X-API-Key"))
             except Exception as e:
                 logger.warning(f"[Job {job_id}] Could not extract current signals: {e}")
             
-            historical = get_historical_snapshots(req.company_url)
+            historical = get_historical_snapshots(req.company_url, current_signals)
             if historical or current_signals:
                 wayback_section = wayback_delta_to_markdown(current_signals, historical)
                 report_markdown += wayback_section
@@ -1020,7 +1021,7 @@ def analyze(req: AnalyzeRequest, api_key: str = Header(None, alias="X-API-Key"))
 
 
 @app.get("/reports/{job_id}/pdf")
-def export_pdf(job_id: str, api_key: str = Header(None, alias="X-API-Key")) -> Response:
+async def export_pdf(job_id: str, api_key: str = Header(None, alias="X-API-Key")) -> Response:
     """
     Export a completed report as PDF.
     """
@@ -1030,7 +1031,7 @@ def export_pdf(job_id: str, api_key: str = Header(None, alias="X-API-Key")) -> R
             raise HTTPException(status_code=401, detail="Invalid or missing API key")
     
     # Try to get from database first
-    report = get_report(job_id)
+    report = await run_in_threadpool(get_report, job_id)
     
     if not report:
         # Fallback to in-memory jobs
@@ -1053,7 +1054,7 @@ def export_pdf(job_id: str, api_key: str = Header(None, alias="X-API-Key")) -> R
         company_name = report.get("company_name", "Company")
     
     try:
-        pdf_bytes = markdown_to_pdf(report_markdown, company_name)
+        pdf_bytes = await markdown_to_pdf_async(report_markdown, company_name)
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
@@ -53,7 +53,7 @@ def fetch_web_surfaces(
         # Clean join: always ensures <domain>/<path>
         target_url = urljoin(company_url.rstrip("/") + "/", path.lstrip("/"))
 
-        logger.info("Agent: probing web surface %s", target_url)
+        logger.info("Agent: probing web surface {}", target_url)
 
         payload = {"url": target_url}
         result = post_json_fn(web_scrape_endpoint, payload)
@@ -62,7 +62,7 @@ def fetch_web_surfaces(
         # NOTE: MCP returns 'success' field, not 'ok'
         if not isinstance(result, dict) or result.get("success") is False:
             logger.warning(
-                "web_scrape failed for %s: %s",
+                "web_scrape failed for {}: {}",
                 target_url,
                 result.get("error") if isinstance(result, dict) else "Non-dict response",
             )
@@ -72,7 +72,7 @@ def fetch_web_surfaces(
         html_content = result.get("raw_html", "") or ""
         if len(html_content) < 500:
             logger.warning(
-                "web_scrape for %s returned thin HTML (%d bytes); treating as low-surface",
+                "web_scrape for {} returned thin HTML ({} bytes); treating as low-surface",
                 target_url,
                 len(html_content),
             )
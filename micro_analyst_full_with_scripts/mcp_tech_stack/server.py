@@ -1,7 +1,13 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 from fastapi import FastAPI
 from loguru import logger
 
+# Optional dependency - finds every marker in one pass over the page
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from .schemas import TechStackInput, TechStackOutput
 
 app = FastAPI(title="MCP Tech Stack Fingerprinting", version="2.0.0")
@@ -89,33 +95,63 @@ OTHER_KEYWORDS = {
 }
 
 
-def _detect_strong(html: str, indicators: dict) -> Tuple[Optional[str], List[str]]:
-    """Detect strong indicators. Returns (label, evidence_list)."""
+ALL_MARKERS = {
+    marker
+    for indicators in (
+        STRONG_CMS_INDICATORS,
+        STRONG_FRAMEWORK_INDICATORS,
+        WEAK_CMS_INDICATORS,
+        WEAK_FRAMEWORK_INDICATORS,
+        ANALYTICS_KEYWORDS,
+        CDN_KEYWORDS,
+        OTHER_KEYWORDS,
+    )
+    for marker in indicators
+}
+
+if ahocorasick is not None:
+    _MARKER_AUTOMATON = ahocorasick.Automaton()
+    for _marker in ALL_MARKERS:
+        _MARKER_AUTOMATON.add_word(_marker, _marker)
+    _MARKER_AUTOMATON.make_automaton()
+else:
+    _MARKER_AUTOMATON = None
+
+
+def _markers_present(html: str) -> Set[str]:
+    """Every marker from ALL_MARKERS that occurs in html, found in a single scan when possible."""
+    if _MARKER_AUTOMATON is not None:
+        return {marker for _, marker in _MARKER_AUTOMATON.iter(html)}
+    return {marker for marker in ALL_MARKERS if marker in html}
+
+
+def _detect_strong(present: Set[str], indicators: dict) -> Tuple[Optional[str], List[str]]:
+    """Detect strong indicators among the present markers. Returns (label, evidence_list)."""
     detected = None
     evidence = []
     for marker, label in indicators.items():
-        if marker in html:
+        if marker in present:
             detected = detected or label
             evidence.append(f"Strong: '{marker}' → {label}")
     return detected, evidence
 
 
-def _detect_weak(html: str, indicators: dict) -> Tuple[Optional[str], List[str]]:
-    """Detect weak indicators. Returns (label, evidence_list)."""
+def _detect_weak(present: Set[str], indicators: dict) -> Tuple[Optional[str], List[str]]:
+    """Detect weak indicators among the present markers. Returns (label, evidence_list)."""
     detected = None
     evidence = []
     for marker, label in indicators.items():
-        if marker in html:
+        if marker in present:
             detected = detected or label
             evidence.append(f"Weak: '{marker}' → {label}")
     return detected, evidence
 
 
-def _detect_all(html: str, indicators: dict) -> List[str]:
-    """Detect all matches (for backwards-compatible list fields)."""
+def _detect_all(present: Set[str], indicators: dict) -> List[str]:
+    """Detect all present matches (for backwards-compatible list fields)."""
     found = []
     for marker, label in indicators.items():
-        if marker in html and label not in found:
+        if marker in present and label not in found:
             found.append(label)
     return found
 
@@ -179,16 +215,19 @@ def run_tech_stack(payload: TechStackInput) -> TechStackOutput:
                 limitations=["Empty or missing HTML input."],
             )
 
+        # One scan of the page; every check below is a set lookup
+        present = _markers_present(html)
+
         # --- Tiered Detection ---
-        strong_cms, strong_cms_evidence = _detect_strong(html, STRONG_CMS_INDICATORS)
-        strong_fw, strong_fw_evidence = _detect_strong(html, STRONG_FRAMEWORK_INDICATORS)
-        weak_cms, weak_cms_evidence = _detect_weak(html, WEAK_CMS_INDICATORS)
-        weak_fw, weak_fw_evidence = _detect_weak(html, WEAK_FRAMEWORK_INDICATORS)
+        strong_cms, strong_cms_evidence = _detect_strong(present, STRONG_CMS_INDICATORS)
+        strong_fw, strong_fw_evidence = _detect_strong(present, STRONG_FRAMEWORK_INDICATORS)
+        weak_cms, weak_cms_evidence = _detect_weak(present, WEAK_CMS_INDICATORS)
+        weak_fw, weak_fw_evidence = _detect_weak(present, WEAK_FRAMEWORK_INDICATORS)
 
         # Backwards-compatible list detection
-        analytics = _detect_all(html, ANALYTICS_KEYWORDS)
-        cdn_list = _detect_all(html, CDN_KEYWORDS)
-        other = _detect_all(html, OTHER_KEYWORDS)
+        analytics = _detect_all(present, ANALYTICS_KEYWORDS)
+        cdn_list = _detect_all(present, CDN_KEYWORDS)
+        other = _detect_all(present, OTHER_KEYWORDS)
         
         # Legacy fields (first match)
         cdn = cdn_list[0] if cdn_list else None
@@ -222,7 +261,7 @@ def run_tech_stack(payload: TechStackInput) -> TechStackOutput:
             frameworks.append(detected_framework)
         # Also add all weak framework detections (Requirement 7: include Next.js)
         for marker, label in WEAK_FRAMEWORK_INDICATORS.items():
-            if marker in html and label not in frameworks:
+            if marker in present and label not in frameworks:
                 frameworks.append(label)
 
         cms_final = detected_cms or probable_cms
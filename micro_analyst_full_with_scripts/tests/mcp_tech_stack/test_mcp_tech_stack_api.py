@@ -29,3 +29,15 @@ def test_tech_stack_run_smoke():
     assert "cdn" in body
     assert "other" in body
     assert "error" in body
+
+
+def test_markers_present_matches_substring_checks(monkeypatch):
+    html = (
+        "<script src='/wp-content/themes/x.js'></script><div class='wp-block'>"
+        "woocommerce gtm.js cdn.cloudflare.net stripe react vue svelte"
+    )
+    expected = {marker for marker in server.ALL_MARKERS if marker in html}
+    assert server._markers_present(html) == expected
+    monkeypatch.setattr(server, "_MARKER_AUTOMATON", None)
+    assert server._markers_present(html) == expected
+    assert {"/wp-content/", "cloudflare", "cdn.cloudflare.net", "vue"} <= expected
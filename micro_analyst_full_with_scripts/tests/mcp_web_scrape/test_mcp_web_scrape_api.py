@@ -24,3 +24,30 @@ def test_web_scrape_run_smoke():
     assert "clean_text" in body
     assert "meta" in body
     assert "error" in body
+
+
+def test_extract_meta_same_with_either_parser(monkeypatch):
+    html = (
+        "<html><head><title> Acme Studio </title>"
+        "<meta name='description' content=' Art classes '></head>"
+        "<body><h1>Welcome</h1><h2>Programs</h2><h2>Faculty <b>List</b></h2><p>Unclosed"
+    )
+    fast = server._extract_meta(html)
+    monkeypatch.setattr(server, "_SOUP_PARSER", "html.parser")
+    assert server._extract_meta(html) == fast
+    assert fast["title"] == "Acme Studio"
+    assert fast["h2"] == ["Programs", "FacultyList"]
+
+
+def test_extract_meta_ignores_tags_outside_the_strainer():
+    html = (
+        "<html><head><title>Acme</title><meta name='description' content='Art'>"
+        "<script>document.title = '<h1>Fake</h1>'</script></head>"
+        "<body><nav><h2>Menu</h2></nav><h1>Welcome <em>home</em></h1><p>Body text</p></body></html>"
+    )
+    assert server._extract_meta(html) == {
+        "title": "Acme",
+        "description": "Art",
+        "h1": ["Welcomehome"],
+        "h2": ["Menu"],
+    }
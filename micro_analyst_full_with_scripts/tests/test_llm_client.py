@@ -33,6 +33,17 @@ def test_plan_tools_focus_flags():
     assert not plan["use_ads_snapshot"]
 
 
+def test_plan_tools_focus_matches_whole_words_only():
+    client = setup_client()
+    plan = client.plan_tools(
+        company_name="Test",
+        company_url="https://example.com",
+        focus="teamwork and reviewer tooling",
+    )
+    assert not plan["use_careers_intel"]
+    assert not plan["use_reviews_snapshot"]
+
+
 def test_synthesize_report_contains_core_headings():
     client = setup_client()
     profile = {
@@ -96,3 +107,80 @@ def test_synthesize_report_contains_core_headings():
     assert "## 6. Hiring & Org Signals" in report
     assert "## 7. Ads & Growth Motions" in report
     assert "## 8. Strategic Recommendations" in report
+
+
+def test_synthesize_report_stream_matches_sync_report():
+    client = setup_client()
+    profile = {"company": {"name": "Example Corp", "url": "https://example.com"}}
+    chunks = list(client.synthesize_report_stream(profile, focus="Test focus"))
+    assert chunks
+    assert "".join(chunks) == client.synthesize_report(profile, focus="Test focus")
+
+
+def test_gemini_coalesces_concurrent_identical_calls(monkeypatch):
+    import threading
+    import time
+
+    from utils.llm_client import GeminiLLMClient
+
+    monkeypatch.delenv("USE_GEMINI_LLM", raising=False)
+    client = GeminiLLMClient()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.2)
+        return "plan"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client._coalesced("k", slow_call)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["plan"] * 4
+    assert len(calls) == 1
+    assert client._inflight == {}
+
+
+def test_get_llm_client_is_memoized():
+    from utils.llm_client import get_llm_client
+
+    get_llm_client.cache_clear()
+    try:
+        assert get_llm_client() is get_llm_client()
+    finally:
+        get_llm_client.cache_clear()
+
+
+def test_gemini_synthesize_report_falls_back_after_partial_stream(monkeypatch):
+    import pytest
+
+    from utils.llm_client import GeminiLLMClient
+
+    monkeypatch.delenv("USE_GEMINI_LLM", raising=False)
+    client = GeminiLLMClient()
+    client._enabled = True
+    client.synth_model_name = "test-model"
+
+    def broken_stream(model_name, prompt):
+        yield "# Partial "
+        yield "report"
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(client, "_generate_stream", broken_stream)
+    profile = {"company": {"name": "Example Corp", "url": "https://example.com"}}
+    delta = {"has_changes": False}
+
+    stream = client.synthesize_report_stream(profile, "Test focus", delta)
+    assert next(stream) == "# Partial "
+    assert next(stream) == "report"
+    with pytest.raises(RuntimeError):
+        next(stream)
+
+    expected = LLMClient().synthesize_report(profile, "Test focus", delta)
+    assert client.synthesize_report(profile, "Test focus", delta) == expected
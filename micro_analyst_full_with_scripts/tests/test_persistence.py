@@ -0,0 +1,503 @@
+"""
+Tests for SQLite-backed report, job and usage persistence.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+# Ensure project root is on sys.path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils import persistence
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point persistence at a fresh temporary database."""
+    persistence.close_pool()
+    monkeypatch.setattr(persistence, "DB_PATH", str(tmp_path / "reports.db"))
+    monkeypatch.setattr(persistence, "JOBS_DB_PATH", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(persistence, "USAGE_DB_PATH", str(tmp_path / "usage.db"))
+    monkeypatch.setattr(persistence, "COHORTS_DB_PATH", str(tmp_path / "cohorts.db"))
+    persistence.init_db()
+    yield persistence
+    persistence.close_pool()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_report_round_trip(db):
+    db.save_report(
+        job_id="r1",
+        company_name="Acme",
+        company_url="https://acme.test",
+        focus="reviews",
+        profile={"company": {"name": "Acme"}},
+        report_markdown="# Acme",
+        api_key="key",
+    )
+
+    report = db.get_report("r1")
+    assert report is not None
+    assert report["report_markdown"] == "# Acme"
+    assert report["profile"] == {"company": {"name": "Acme"}}
+    assert [r["id"] for r in db.get_latest_reports("https://acme.test")] == ["r1"]
+
+
+def test_job_round_trip_and_pending(db):
+    db.save_job("j1", "running", 40, "https://a.test", "A", None, "key")
+    db.save_job("j2", "complete", 100, "https://b.test", "B", None, "key", result={"ok": True})
+
+    job = db.get_job_db("j2")
+    assert job["status"] == "complete"
+    assert job["result"] == {"ok": True}
+    assert [j["id"] for j in db.load_pending_jobs()] == ["j1"]
+
+    db.delete_job("j1")
+    assert db.get_job_db("j1") is None
+
+
+def test_concurrent_usage_increments(db):
+    def bump():
+        for _ in range(10):
+            db.increment_usage("key")
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert db.get_usage_today("key") == 40
+
+
+def test_failed_write_does_not_block_later_writes(db):
+    with pytest.raises(Exception):
+        db._execute_write("jobs", "INSERT INTO no_such_table VALUES (1)")
+
+    assert db._execute_write("jobs", "DELETE FROM jobs WHERE id = ?", ("missing",)) == 0
+    db.save_job("j3", "queued", 0, "https://c.test", None, None, "key")
+    assert db.get_job_db("j3")["status"] == "queued"
+
+
+def test_bulk_save_and_delete_span_param_chunks(db, monkeypatch):
+    jobs = [
+        {"id": f"b{i}", "status": "running", "progress": i % 100, "company_url": "https://x.test", "api_key": "key"}
+        for i in range(250)
+    ]
+    db.save_jobs_bulk(jobs)
+    assert len(list(db.load_pending_jobs())) == 250
+    monkeypatch.setattr(db, "_FETCH_BATCH", 64)
+    assert len({j["id"] for j in db.load_pending_jobs()}) == 250
+
+    db.save_jobs_bulk([{**jobs[0], "status": "failed", "error": "interrupted"}])
+    assert db.get_job_db("b0")["error"] == "interrupted"
+
+    db.delete_job([j["id"] for j in jobs])
+    assert list(db.load_pending_jobs()) == []
+
+
+def test_failed_legacy_adoption_rolls_back_and_detaches(tmp_path, monkeypatch):
+    legacy = tmp_path / "reports.db"
+    conn = sqlite3.connect(legacy)
+    # Selecting progress overflows, so the copy fails inside the transaction
+    conn.execute(
+        "CREATE VIEW jobs AS SELECT 'old' AS id, 'queued' AS status, "
+        "abs(-9223372036854775807 - 1) AS progress"
+    )
+    conn.commit()
+    conn.close()
+
+    persistence.close_pool()
+    monkeypatch.setattr(persistence, "DB_PATH", str(legacy))
+    monkeypatch.setattr(persistence, "JOBS_DB_PATH", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(persistence, "USAGE_DB_PATH", str(tmp_path / "usage.db"))
+    monkeypatch.setattr(persistence, "COHORTS_DB_PATH", str(tmp_path / "cohorts.db"))
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="integer overflow"):
+            persistence.init_db()
+        with persistence.get_conn("jobs", write=True) as wconn:
+            assert "legacy" not in {r[1] for r in wconn.execute("PRAGMA database_list")}
+            assert wconn.execute("PRAGMA user_version").fetchone()[0] == 0
+    finally:
+        persistence.close_pool()
+
+
+def test_cohort_blobs_round_trip_and_legacy_text_rows(db):
+    db.save_cohort(
+        "c1", "https://anchor.test", None, "proposed",
+        candidates=[{"url": "https://peer.test"}],
+        matrix={"rows": [1, 2]},
+    )
+    cohort = db.get_cohort("c1")
+    assert cohort["candidates"] == [{"url": "https://peer.test"}]
+    assert cohort["matrix"] == {"rows": [1, 2]}
+    assert cohort["job_ids"] == []
+
+    # Rows written before the BLOB switch hold JSON as TEXT.
+    db._execute_write(
+        "jobs",
+        "INSERT INTO jobs (id, status, result_json) VALUES (?, ?, ?)",
+        ("legacy", "complete", '{"ok": true}'),
+    )
+    assert db.get_job_db("legacy")["result"] == {"ok": True}
+
+
+def test_large_payloads_are_stored_compressed(db):
+    profile = {"pages": ["lorem ipsum " * 50 for _ in range(20)]}
+    markdown = "## Section\n" + "body text " * 500
+    db.save_report("big", "Big", "https://big.test", None, profile, markdown, "key")
+
+    with db.get_conn("reports") as conn:
+        row = conn.execute("SELECT profile_json, report_markdown FROM reports WHERE id = 'big'").fetchone()
+    assert row[0][:1] in (db._TAG_ZSTD, db._TAG_ZLIB)
+    assert len(row[1]) < len(markdown)
+
+    report = db.get_report("big")
+    assert report["profile"] == profile
+    assert report["report_markdown"] == markdown
+
+
+def test_usage_cache_tracks_increments(db):
+    assert db.get_usage_today("k2") == 0
+    db.increment_usage("k2")
+    db.increment_usage("k2")
+    assert db._usage_cache[db._usage_key("k2")] == 2
+    assert db.get_usage_today("k2") == 2
+    assert db.check_quota("k2") == (True, db.DAILY_QUOTA_PER_KEY - 2)
+
+
+def test_tables_live_in_separate_files_and_legacy_rows_are_adopted(tmp_path, monkeypatch):
+    legacy = tmp_path / "reports.db"
+    conn = sqlite3.connect(legacy)
+    conn.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, status TEXT, progress INTEGER)")
+    conn.execute("INSERT INTO jobs VALUES ('old', 'queued', 5)")
+    conn.commit()
+    conn.close()
+
+    persistence.close_pool()
+    monkeypatch.setattr(persistence, "DB_PATH", str(legacy))
+    monkeypatch.setattr(persistence, "JOBS_DB_PATH", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(persistence, "USAGE_DB_PATH", str(tmp_path / "usage.db"))
+    monkeypatch.setattr(persistence, "COHORTS_DB_PATH", str(tmp_path / "cohorts.db"))
+    try:
+        persistence.init_db()
+        persistence.init_db()
+        assert [j["id"] for j in persistence.load_pending_jobs()] == ["old"]
+
+        persistence.increment_usage("key")
+        persistence._flush_usage()
+        with persistence.get_conn("usage") as uconn:
+            assert uconn.execute("SELECT COUNT(*) FROM usage").fetchone()[0] == 1
+        with persistence.get_conn("reports") as rconn:
+            tables = {r[0] for r in rconn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert "usage" not in tables
+    finally:
+        persistence.close_pool()
+
+
+def test_save_cohort_with_jobs_commits_both_databases(db):
+    db.save_cohort_with_jobs(
+        {"cohort_id": "c2", "anchor_url": "https://anchor.test", "category_hint": None,
+         "status": "analyzing", "job_ids": ["q1", "q2"], "api_key": "key"},
+        [
+            {"id": "q1", "status": "queued", "company_url": "https://p1.test", "api_key": "key"},
+            {"id": "q2", "status": "queued", "company_url": "https://p2.test", "api_key": "key"},
+        ],
+    )
+    assert db.get_cohort("c2")["job_ids"] == ["q1", "q2"]
+    assert {j["id"] for j in db.load_pending_jobs()} == {"q1", "q2"}
+
+    # A later per-job save fills in fields the fan-out row left empty.
+    db.save_job("q1", "running", 10, "https://p1.test", None, "SaaS cohort analysis", "key")
+    assert db.get_job_db("q1")["focus"] == "SaaS cohort analysis"
+
+
+def test_cohort_fan_out_rows_record_focus(db):
+    from agent.cohort import COHORT_ANALYSIS_FOCUS, start_cohort_analysis
+
+    db.save_cohort("c3", "https://anchor.test", None, "confirmed",
+                   confirmed_urls=["https://p1.test"], api_key="key")
+    start_cohort_analysis("c3", lambda url, key: "f1", "key")
+
+    job = db.get_job_db("f1")
+    assert job["status"] == "queued"
+    assert job["focus"] == COHORT_ANALYSIS_FOCUS
+
+
+def test_db_metrics_record_operations_and_pools(db):
+    db.save_job("m1", "queued", 0, "https://m.test", None, None, "key")
+    db.get_job_db("m1")
+
+    metrics = db.get_db_metrics()
+    assert metrics["ops"]["sqlite.save_job"]["count"] >= 1
+    assert metrics["ops"]["sqlite.get_job_db"]["max_ms"] >= 0
+    assert any(name.startswith("sqlite.write_batch.jobs") for name in metrics["ops"])
+    assert metrics["pools"]["jobs"]["readers_open"] >= 1
+
+
+def test_pending_jobs_skip_result_blob_unless_requested(db):
+    db.save_job("p1", "running", 50, "https://p.test", None, None, "key", result={"partial": 1})
+
+    (job,) = db.load_pending_jobs()
+    assert job["id"] == "p1" and job["result"] is None
+    (job,) = db.load_pending_jobs(include_result=True)
+    assert job["result"] == {"partial": 1}
+
+
+def test_snapshot_db_copies_live_database(db, tmp_path):
+    db.save_job("s1", "queued", 0, "https://s.test", None, None, "key")
+
+    dest = tmp_path / "backup" / "jobs.db"
+    dest.parent.mkdir()
+    db.snapshot_db(str(dest), pages_per_step=1, db="jobs")
+
+    conn = sqlite3.connect(dest)
+    try:
+        assert conn.execute("SELECT id FROM jobs").fetchall() == [("s1",)]
+    finally:
+        conn.close()
+    assert not (tmp_path / "backup" / "jobs.db.tmp").exists()
+
+
+def test_reader_pool_is_bounded_and_survives_close(db, monkeypatch):
+    pool = db._get_pool("reports")
+    monkeypatch.setattr(pool, "size", 2)
+    seen = set()
+    barrier = threading.Barrier(4)
+
+    def read():
+        barrier.wait()
+        with db.get_conn("reports") as conn:
+            seen.add(id(conn))
+            conn.execute("SELECT COUNT(*) FROM reports").fetchone()
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(seen) <= 2
+
+    with db.get_conn("reports") as conn:
+        db.close_pool()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert db.get_report("missing") is None
+
+
+def test_templated_sql_is_built_once_per_shape(db):
+    db._sql.cache_clear()
+    for _ in range(3):
+        list(db.load_pending_jobs())
+        db.delete_job(["x", "y"])
+    info = db._sql.cache_info()
+    assert info.misses == 2 and info.hits == 4
+
+
+def test_progress_ticks_are_buffered_until_terminal_status(db, monkeypatch):
+    monkeypatch.setattr(db, "JOB_FLUSH_INTERVAL_SECONDS", 60)
+    for progress in (10, 20, 30):
+        db.save_job("t1", "running", progress, "https://t.test", "T" if progress == 10 else None, None, "key")
+    assert db._job_buffer["t1"][2] == 30
+    assert db._job_buffer["t1"][4] == "T"
+    with db.get_conn("jobs") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+
+    db.save_job("t1", "complete", 100, "https://t.test", None, None, "key", result={"ok": True})
+    assert db._job_buffer == {}
+    with db.get_conn("jobs") as conn:
+        row = conn.execute("SELECT status, company_name FROM jobs WHERE id = 't1'").fetchone()
+    assert row == ("complete", "T")
+
+
+def test_buffered_jobs_flush_on_timer_and_reads(db, monkeypatch):
+    monkeypatch.setattr(db, "JOB_FLUSH_INTERVAL_SECONDS", 0.05)
+    db.save_job("t2", "running", 10, "https://t.test", None, None, "key")
+    deadline = time.time() + 2
+    while db._job_buffer and time.time() < deadline:
+        time.sleep(0.01)
+    assert db._job_buffer == {}
+
+    db.save_job("t3", "queued", 0, "https://t.test", None, None, "key")
+    assert db.get_job_db("t3")["status"] == "queued"
+
+
+def test_json_blobs_handle_dates_and_sets(db):
+    result = {"baseline_date": datetime(2024, 1, 2, 3, 4, 5), "tags": {"a"}, 1: "x"}
+    db.save_job("d1", "complete", 100, "https://d.test", None, None, "key", result=result)
+    assert db.get_job_db("d1")["result"] == {
+        "baseline_date": "2024-01-02T03:04:05",
+        "tags": ["a"],
+        "1": "x",
+    }
+
+
+def test_usage_increments_are_batched(db, monkeypatch):
+    monkeypatch.setattr(db, "USAGE_FLUSH_EVERY", 3)
+
+    def stored():
+        with db.get_conn("usage") as conn:
+            row = conn.execute("SELECT report_count FROM usage WHERE api_key = 'k3'").fetchone()
+        return row[0] if row else 0
+
+    db.increment_usage("k3")
+    db.increment_usage("k3")
+    assert stored() == 0
+    assert db.get_usage_today("k3") == 2
+
+    db.increment_usage("k3")
+    assert stored() == 3
+    db.increment_usage("k3")
+    db.close_pool()
+    assert stored() == 4
+
+
+def test_pending_jobs_query_uses_partial_index(db):
+    sql = db._SQL_SELECT_PENDING_JOBS.format(columns=db._PENDING_JOB_ROW.columns)
+    with db.get_conn("jobs") as conn:
+        plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+    assert "idx_jobs_pending" in plan
+
+
+def test_report_html_fills_template_and_escapes_company_name(monkeypatch):
+    markdown = pytest.importorskip("markdown")
+    monkeypatch.setattr(persistence, "markdown", markdown)
+
+    page = persistence._render_html("# Findings\n\nBody", "Acme <R&D>")
+    assert "<title>OSINT Report - Acme &lt;R&amp;D&gt;</title>" in page
+    assert "<h1>Findings</h1>" in page
+    assert "$" not in page
+
+
+def test_markdown_conversion_is_memoized(monkeypatch):
+    markdown = pytest.importorskip("markdown")
+    monkeypatch.setattr(persistence, "markdown", markdown)
+    persistence._markdown_to_html.cache_clear()
+
+    first = persistence._render_html("# Same report", "A")
+    second = persistence._render_html("# Same report", "B")
+    assert persistence._markdown_to_html.cache_info().hits == 1
+    assert "<h1>Same report</h1>" in first and "- B</title>" in second
+
+
+def test_async_pdf_export_requires_weasyprint(monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr(persistence, "WEASYPRINT_AVAILABLE", False)
+    with pytest.raises(RuntimeError, match="weasyprint"):
+        asyncio.run(persistence.markdown_to_pdf_async("# Report"))
+    assert persistence._pdf_pool is None
+
+
+def test_cohort_reports_are_compressed_and_read_back(db):
+    report = "## Cohort\n" + "peer comparison " * 200
+    db.save_cohort("c3", "https://anchor.test", None, "complete", report_md=report, drift_report_md="short")
+
+    with db.get_conn("cohorts") as conn:
+        stored, drift = conn.execute(
+            "SELECT report_md, drift_report_md FROM cohorts WHERE cohort_id = 'c3'"
+        ).fetchone()
+    assert len(stored) < len(report)
+    assert drift == b"short"
+
+    cohort = db.get_cohort("c3")
+    assert cohort["report_md"] == report
+    assert cohort["drift_report_md"] == "short"
+
+    # Rows written before compression hold plain TEXT.
+    db._execute_write("cohorts", "UPDATE cohorts SET report_md = 'legacy' WHERE cohort_id = 'c3'")
+    assert db.get_cohort("c3")["report_md"] == "legacy"
+
+
+def test_writer_runs_executemany_ops(db):
+    rows = [(f"e{i}", "queued") for i in range(5)]
+    fut = db._get_pool("jobs").submit("INSERT INTO jobs (id, status) VALUES (?, ?)", rows, many=True)
+    assert fut.result() == 5
+
+    bad = db._get_pool("jobs").submit("INSERT INTO jobs (id, status) VALUES (?, ?)", [("e0", "queued")], many=True)
+    with pytest.raises(sqlite3.IntegrityError):
+        bad.result()
+    assert len(list(db.load_pending_jobs())) == 5
+
+
+def test_writer_optimizes_periodically_and_checkpoints_on_close(db, monkeypatch):
+    monkeypatch.setattr(db, "SQLITE_OPTIMIZE_EVERY", 2)
+    pool = db._get_pool("jobs")
+    calls = []
+    with monkeypatch.context() as m:
+        m.setattr(pool, "_maintain", lambda checkpoint: calls.append(checkpoint))
+        for i in range(4):
+            db._execute_write("jobs", "INSERT INTO jobs (id) VALUES (?)", (f"o{i}",))
+    assert calls == [False, False]
+
+    db.save_job("o9", "running", 10, "https://o.test", None, None, "key")
+    db._flush_jobs()
+    assert os.path.getsize(db.JOBS_DB_PATH + "-wal") > 0
+    # An outside connection keeps SQLite from deleting the WAL on close.
+    other = sqlite3.connect(db.JOBS_DB_PATH)
+    try:
+        other.execute("SELECT 1 FROM jobs").fetchall()
+        db.close_pool()
+        assert os.path.getsize(db.JOBS_DB_PATH + "-wal") == 0
+    finally:
+        other.close()
+
+
+def test_async_pdf_export_caches_rendered_bytes(monkeypatch):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    renders = []
+
+    def fake_render(markdown_text, company_name):
+        renders.append((markdown_text, company_name))
+        return f"%PDF {company_name}".encode()
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(persistence, "WEASYPRINT_AVAILABLE", True)
+    monkeypatch.setattr(persistence, "markdown_to_pdf", fake_render)
+    monkeypatch.setattr(persistence, "_get_pdf_pool", lambda: executor)
+    monkeypatch.setattr(persistence, "PDF_CACHE_SIZE", 2)
+    monkeypatch.setattr(persistence, "_pdf_cache", persistence.OrderedDict())
+
+    async def export_all():
+        return [
+            await persistence.markdown_to_pdf_async("# R", name)
+            for name in ("A", "A", "B", "C", "A")
+        ]
+
+    try:
+        pdfs = asyncio.run(export_all())
+    finally:
+        executor.shutdown()
+    assert pdfs[0] == pdfs[1] == pdfs[4] == b"%PDF A"
+    # "A" was evicted by "B" and "C", so it is rendered a second time.
+    assert [name for _, name in renders] == ["A", "B", "C", "A"]
+
+
+def test_pooled_connections_run_in_autocommit_mode(db):
+    with db.get_conn("jobs") as conn:
+        assert conn.isolation_level is None
+        conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        assert not conn.in_transaction
+
+    with pytest.raises(Exception):
+        db._execute_write("jobs", "INSERT INTO no_such_table VALUES (1)")
+    with db.get_conn("jobs", write=True) as conn:
+        assert conn.isolation_level is None
+        assert not conn.in_transaction
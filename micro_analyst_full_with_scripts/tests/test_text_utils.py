@@ -27,3 +27,23 @@ def test_truncate_text_behaviour():
     assert truncate_text(text, 5) == "abcde"
     # type: ignore[arg-type]
     assert truncate_text(None, 5) is None  # noqa: E501
+    assert truncate_text(text, 0) == ""
+    # Within the limit nothing is copied.
+    assert truncate_text(text, len(text)) is text
+
+
+def test_clean_html_to_text_parsers_agree(monkeypatch):
+    from utils import text_utils
+
+    html = (
+        "<title>T</title><p>Some <b>bold</b>text.</p><script>x()</script>"
+        "<!-- note --><div>  a&amp;b </div><STYLE>p{}</STYLE>"
+    )
+    expected = "T Some bold text. a&b"
+
+    # Disable the fast parsers one at a time, ending on BeautifulSoup.
+    assert clean_html_to_text(html) == expected
+    monkeypatch.setattr(text_utils, "HTMLParser", None)
+    assert clean_html_to_text(html) == expected
+    monkeypatch.setattr(text_utils, "etree", None)
+    assert clean_html_to_text(html) == expected
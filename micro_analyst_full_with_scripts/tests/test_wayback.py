@@ -6,6 +6,8 @@ All tests use mocked HTTP responses - no real network calls.
 
 import os
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
 
@@ -26,6 +28,15 @@ from utils.wayback import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_wayback_cache(monkeypatch):
+    """Keep the on-disk snapshot cache out of tests unless one opts in."""
+    import utils.wayback as wayback
+    monkeypatch.setattr(wayback, "WAYBACK_CACHE_PATH", "")
+    monkeypatch.setattr(wayback, "_cache_conn", None)
+    monkeypatch.setattr(wayback, "_signals_cache", OrderedDict())
+
+
 # ---------------------------------------------------------------------------
 # Sample Data
 # ---------------------------------------------------------------------------
@@ -81,7 +92,7 @@ SAMPLE_HTML_MINIMAL = """
 # Tests: list_snapshots
 # ---------------------------------------------------------------------------
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_list_snapshots_success(mock_get):
     """CDX API returns valid JSON response."""
     mock_response = Mock()
@@ -97,7 +108,7 @@ def test_list_snapshots_success(mock_get):
     assert result[0]["statuscode"] == "200"
 
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_list_snapshots_empty_response(mock_get):
     """CDX API returns no results."""
     mock_response = Mock()
@@ -110,7 +121,7 @@ def test_list_snapshots_empty_response(mock_get):
     assert result == []
 
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_list_snapshots_timeout(mock_get):
     """CDX API timeout returns empty list."""
     import requests
@@ -121,7 +132,7 @@ def test_list_snapshots_timeout(mock_get):
     assert result == []
 
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_list_snapshots_http_error(mock_get):
     """CDX API returns non-200 status."""
     mock_response = Mock()
@@ -183,16 +194,36 @@ def test_select_closest_snapshot_single():
     assert result["timestamp"] == "20231015000000"
 
 
+def test_archive_calls_share_one_pooled_session():
+    """CDX and snapshot requests reuse a keep-alive session with retries."""
+    from utils.wayback import _SESSION, WAYBACK_USER_AGENT
+
+    adapter = _SESSION.get_adapter("https://web.archive.org/cdx/search/cdx")
+    assert _SESSION.headers["User-Agent"] == WAYBACK_USER_AGENT
+    assert adapter.max_retries.total == 2
+    assert set(adapter.max_retries.status_forcelist) == {429, 502, 503, 504}
+
+
+def test_session_requests_compressed_archives():
+    """Snapshots are fetched compressed, in encodings urllib3 can decode."""
+    from urllib3.response import HTTPResponse
+    from utils.wayback import _SESSION
+
+    advertised = [enc.strip() for enc in _SESSION.headers["Accept-Encoding"].split(",")]
+    assert "gzip" in advertised
+    assert set(advertised) <= set(HTTPResponse.CONTENT_DECODERS)
+
+
 # ---------------------------------------------------------------------------
 # Tests: fetch_snapshot_html
 # ---------------------------------------------------------------------------
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_fetch_snapshot_html_success(mock_get):
     """Wayback fetch returns HTML content."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = SAMPLE_HTML.encode('utf-8')
+    mock_response.iter_content.return_value = [SAMPLE_HTML.encode('utf-8')]
     mock_get.return_value = mock_response
     
     result = fetch_snapshot_html("20231015120000", "https://example.com/")
@@ -202,7 +233,32 @@ def test_fetch_snapshot_html_success(mock_get):
     mock_get.assert_called_once()
 
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
+def test_fetch_snapshot_html_stops_reading_at_byte_cap(mock_get):
+    """Oversized archives are cut off without downloading the rest."""
+    from utils.wayback import MAX_HTML_BYTES
+
+    chunk = b"x" * 65536
+    pulled = []
+
+    def chunks(chunk_size):
+        while True:
+            pulled.append(chunk)
+            yield chunk
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.side_effect = chunks
+    mock_get.return_value = mock_response
+
+    result = fetch_snapshot_html("20231015120000", "https://example.com/")
+
+    assert len(result) == MAX_HTML_BYTES
+    assert len(pulled) == -(-MAX_HTML_BYTES // len(chunk))
+    mock_response.close.assert_called_once()
+
+
+@patch('utils.wayback._SESSION.get')
 def test_fetch_snapshot_html_not_found(mock_get):
     """Wayback returns 404 for missing snapshot."""
     mock_response = Mock()
@@ -214,7 +270,7 @@ def test_fetch_snapshot_html_not_found(mock_get):
     assert result is None
 
 
-@patch('utils.wayback.requests.get')
+@patch('utils.wayback._SESSION.get')
 def test_fetch_snapshot_html_timeout(mock_get):
     """Wayback fetch timeout returns None."""
     import requests
@@ -372,14 +428,18 @@ def test_wayback_delta_to_markdown_no_current():
 # Tests: get_historical_snapshots (integration with mocks)
 # ---------------------------------------------------------------------------
 
+def _days_ago_ts(days):
+    return (datetime.now() - timedelta(days=days)).strftime("%Y%m%d%H%M%S")
+
+
 @patch('utils.wayback.fetch_snapshot_html')
 @patch('utils.wayback.list_snapshots')
 def test_get_historical_snapshots_success(mock_list, mock_fetch):
     """Full flow returns extracted signals with closest selection."""
     mock_list.return_value = [
-        {"timestamp": "20231010000000", "original": "https://example.com/"},
-        {"timestamp": "20231015000000", "original": "https://example.com/"},
-        {"timestamp": "20231020000000", "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(35), "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(30), "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(25), "original": "https://example.com/"},
     ]
     mock_fetch.return_value = SAMPLE_HTML
     
@@ -392,6 +452,29 @@ def test_get_historical_snapshots_success(mock_list, mock_fetch):
     assert result[0]["signals"]["script_count"] == 3
 
 
+@patch('utils.wayback.fetch_snapshot_html')
+@patch('utils.wayback.list_snapshots')
+def test_get_historical_snapshots_fetches_targets_concurrently(mock_list, mock_fetch):
+    """Both targets are in flight at once and results keep label order."""
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fetch(timestamp, original_url):
+        both_started.wait()
+        return SAMPLE_HTML
+
+    mock_list.return_value = [
+        {"timestamp": _days_ago_ts(30), "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(180), "original": "https://example.com/"},
+    ]
+    mock_fetch.side_effect = fetch
+
+    result = get_historical_snapshots("https://example.com/")
+
+    assert [r["label"] for r in result] == ["~30 days ago", "~180 days ago"]
+
+
 @patch('utils.wayback.list_snapshots')
 def test_get_historical_snapshots_no_snapshots(mock_list):
     """No snapshots available returns empty list."""
@@ -953,3 +1036,348 @@ class TestFallbackMarkdownRendering:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_extract_wayback_signals_same_with_either_parser(monkeypatch):
+    """lexbor and html.parser yield identical signals."""
+    import utils.wayback as wayback
+
+    pages = [SAMPLE_HTML, SAMPLE_HTML_MINIMAL, SAMPLE_INSTITUTIONAL_HTML, "<html><head><title>Broken"]
+    fast = [extract_wayback_signals(page) for page in pages]
+    monkeypatch.setattr(wayback, "_signals_cache", OrderedDict())
+    monkeypatch.setattr(wayback, "LexborHTMLParser", None)
+    monkeypatch.setattr(wayback, "_SOUP_PARSER", "html.parser")
+    assert [extract_wayback_signals(page) for page in pages] == fast
+
+
+def test_keyword_scan_reports_groups_and_frameworks(monkeypatch):
+    """The one-pass keyword scan finds the same groups with or without the automaton."""
+    import utils.wayback as wayback
+
+    page = "<a href='/pricing'>Sign in</a><div data-reactroot></div><img src='/wp-content/x.png'>"
+    expected = {"pricing", "login", "React", "WordPress"}
+    if wayback._KEYWORD_AUTOMATON is not None:
+        assert wayback._scan_keywords(page.lower()) == expected
+    monkeypatch.setattr(wayback, "_KEYWORD_AUTOMATON", None)
+    assert wayback._scan_keywords(page.lower()) == expected
+
+    result = extract_wayback_signals(page)
+    assert result["framework_hints"] == ["React", "WordPress"]
+    assert result["has_pricing_keywords"] and result["has_login"]
+    assert not result["has_docs_keywords"] and not result["has_trust"]
+
+
+def test_section_regexes_match_any_listed_pattern():
+    """Each combined section regex hits exactly when one of its patterns does."""
+    import re
+    from utils.wayback import SECTION_PATTERNS, _SECTION_REGEXES
+
+    headings = ["our story", "apply today", "degree courses", "meet the staff", "reach us", "news", "staffing"]
+    for section_name, patterns in SECTION_PATTERNS.items():
+        for text in headings:
+            expected = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+            assert bool(_SECTION_REGEXES[section_name].search(text)) == expected
+
+
+def test_prestige_signals_are_case_insensitive():
+    """Prestige keywords match regardless of case in the page."""
+    html = (
+        "<html><body><p>ACCREDITED by the board. Established 1921.</p>"
+        "<p>Gallery shows and an Exhibition with our PARTNERS and a Partnership.</p>"
+        "</body></html>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    prestige = extract_institutional_signals(html, soup)["prestige_signals"]
+
+    assert prestige["has_accreditation"] is True
+    assert prestige["founding_year"] == 1921
+    assert prestige["exhibition_mentions"] == 2
+    assert prestige["partner_mentions"] == 1
+
+
+def test_extract_wayback_signals_parses_once_and_counts_utf8_bytes():
+    """One parse feeds every extractor; html_bytes is the UTF-8 length."""
+    import utils.wayback as wayback
+
+    page = SAMPLE_INSTITUTIONAL_HTML.replace("</body>", "<p>Café — über</p></body>")
+    with patch.object(wayback, "BeautifulSoup", wraps=BeautifulSoup) as parse:
+        result = extract_wayback_signals(page)
+        assert parse.call_count == (0 if wayback.LexborHTMLParser is not None else 1)
+    assert result["html_bytes"] == len(page.encode("utf-8"))
+    assert extract_wayback_signals(SAMPLE_HTML)["html_bytes"] == len(SAMPLE_HTML)
+    assert result["institutional_signals"]["prestige_signals"]["has_accreditation"] is True
+
+
+def _enable_cache(monkeypatch, tmp_path):
+    import utils.wayback as wayback
+    monkeypatch.setattr(wayback, "WAYBACK_CACHE_PATH", str(tmp_path / "cache" / "wayback.db"))
+    monkeypatch.setattr(wayback, "_cache_conn", None)
+    return wayback
+
+
+@patch('utils.wayback._SESSION.get')
+def test_list_snapshots_served_from_disk_cache(mock_get, monkeypatch, tmp_path):
+    """A repeated CDX query is answered from the cache until its TTL lapses."""
+    wayback = _enable_cache(monkeypatch, tmp_path)
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = SAMPLE_CDX_RESPONSE
+    mock_get.return_value = mock_response
+
+    first = list_snapshots("https://example.com/", from_ts="20231001", to_ts="20231031")
+    second = list_snapshots("https://example.com/", from_ts="20231001", to_ts="20231031")
+    assert first == second and len(first) == 2
+    assert mock_get.call_count == 1
+
+    # A different window is a different query
+    list_snapshots("https://example.com/", from_ts="20230101", to_ts="20230131")
+    assert mock_get.call_count == 2
+
+    now = time.time()
+    monkeypatch.setattr(wayback.time, "time", lambda: now + wayback.CDX_CACHE_TTL_SECONDS + 1)
+    list_snapshots("https://example.com/", from_ts="20231001", to_ts="20231031")
+    assert mock_get.call_count == 3
+
+
+@patch('utils.wayback._SESSION.get')
+def test_fetch_snapshot_html_caches_pages_and_not_found(mock_get, monkeypatch, tmp_path):
+    """Snapshot HTML and 404s are cached; transient failures are not."""
+    import requests
+    _enable_cache(monkeypatch, tmp_path)
+
+    ok = Mock(status_code=200)
+    ok.iter_content.return_value = [SAMPLE_HTML.encode("utf-8")]
+    missing = Mock(status_code=404)
+    mock_get.side_effect = [ok, missing, requests.Timeout("slow"), ok]
+
+    assert fetch_snapshot_html("20231015120000", "https://example.com/") == SAMPLE_HTML
+    assert fetch_snapshot_html("20231015120000", "https://example.com/") == SAMPLE_HTML
+    assert fetch_snapshot_html("20200101000000", "https://example.com/gone") is None
+    assert fetch_snapshot_html("20200101000000", "https://example.com/gone") is None
+    assert fetch_snapshot_html("20210101000000", "https://example.com/") is None
+    assert fetch_snapshot_html("20210101000000", "https://example.com/") == SAMPLE_HTML
+    assert mock_get.call_count == 4
+
+
+def test_word_count_ignores_whitespace_runs_inside_text():
+    """Newlines and repeated spaces inside a text node don't add words."""
+    from utils.wayback import _text_metrics
+
+    metrics = _text_metrics("Open  studio\n   hours daily", "")
+    assert metrics["word_count"] == 4
+    assert metrics["char_count"] == len("Open  studio\n   hours daily")
+
+
+def test_faculty_names_skip_link_captions():
+    """Capitalized link captions in the faculty section are not counted as names."""
+    from utils.wayback import _extract_prestige_signals
+
+    section = "Our Faculty Jane Smith, Robert Jones. Read More About Us | View All | See more"
+    prestige = _extract_prestige_signals("", section)
+    # "Our Faculty Jane Smith" and "Robert Jones" match; "Read More About Us" and "View All" are dropped
+    assert prestige["faculty_name_count"] == 2
+
+
+def test_keyword_scan_stops_once_everything_is_found(monkeypatch):
+    """The substring fallback stops scanning after every tag has matched."""
+    import utils.wayback as wayback
+
+    class CountingStr(str):
+        checks = 0
+
+        def __contains__(self, needle):
+            CountingStr.checks += 1
+            return super().__contains__(needle)
+
+    monkeypatch.setattr(wayback, "_KEYWORD_AUTOMATON", None)
+    every_needle = " ".join(needle for needle, _ in wayback._KEYWORD_TAGS)
+    page = CountingStr(every_needle)
+    assert wayback._scan_keywords(page) == wayback._ALL_TAGS
+    # One check per group/framework: later needles of a found tag are skipped
+    assert CountingStr.checks == len(wayback._ALL_TAGS)
+
+
+@patch('utils.wayback._SESSION.get')
+def test_list_snapshots_stops_at_limit(mock_get):
+    """Rows past the requested limit are never turned into dicts."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = SAMPLE_CDX_MULTI
+    mock_get.return_value = mock_response
+
+    result = list_snapshots("https://example.com/", limit=2)
+
+    assert [snap["timestamp"] for snap in result] == ["20231010000000", "20231012000000"]
+    assert mock_get.call_args.kwargs["params"]["limit"] == "2"
+
+
+def test_select_closest_snapshot_pads_short_and_skips_bad_timestamps():
+    """Short timestamps are right-padded and unparsable ones never win."""
+    snapshots = [
+        {"timestamp": "garbage", "original": "https://example.com/"},
+        {"timestamp": "20231014", "original": "https://example.com/"},
+        {"timestamp": "20231001000000", "original": "https://example.com/"},
+    ]
+    result = _select_closest_snapshot(snapshots, datetime(2023, 10, 14, 6, 0, 0))
+    assert result["timestamp"] == "20231014"
+
+
+def test_extract_wayback_signals_memoized_by_content(monkeypatch):
+    """Identical HTML is parsed once and every caller gets an independent copy."""
+    import utils.wayback as wayback
+
+    monkeypatch.setattr(wayback, "SIGNALS_CACHE_SIZE", 2)
+    with patch.object(wayback, "_extract_wayback_signals", wraps=wayback._extract_wayback_signals) as extract:
+        first = extract_wayback_signals(SAMPLE_HTML)
+        first["framework_hints"].append("Mutated")
+        second = extract_wayback_signals(SAMPLE_HTML)
+        assert extract.call_count == 1
+        assert second["framework_hints"] == ["Next.js"]
+
+        extract_wayback_signals(SAMPLE_HTML_MINIMAL)
+        extract_wayback_signals(SAMPLE_INSTITUTIONAL_HTML)
+        extract_wayback_signals(SAMPLE_HTML)  # evicted by the two pages above
+        assert extract.call_count == 4
+
+
+def test_format_snapshot_date_matches_strftime():
+    """The sliced date string equals the strptime/strftime rendering."""
+    from utils.wayback import _format_snapshot_date
+
+    for ts in ["20231015120000", "20230105000000", "19991231", "20240229", "2023101"]:
+        expected = datetime.strptime(ts[:8], "%Y%m%d").strftime("%B %d, %Y")
+        assert _format_snapshot_date(ts) == expected
+    for bad in ["20230230000000", "20231301000000", "garbage", ""]:
+        assert _format_snapshot_date(bad) == bad
+
+
+def test_extract_wayback_signals_lowercases_page_once():
+    """Keyword, framework and prestige scans share a single lowercased copy."""
+
+    class CountingStr(str):
+        lowered = 0
+
+        def lower(self):
+            CountingStr.lowered += 1
+            return super().lower()
+
+    extract_wayback_signals(CountingStr(SAMPLE_INSTITUTIONAL_HTML))
+    assert CountingStr.lowered == 1
+
+
+@patch('utils.wayback.fetch_snapshot_html')
+@patch('utils.wayback.list_snapshots')
+def test_get_historical_snapshots_uses_one_cdx_query(mock_list, mock_fetch):
+    """Both windows come from a single daily-collapsed CDX query and stay separate."""
+    from utils.wayback import CDX_BATCH_LIMIT
+
+    mock_list.return_value = [
+        {"timestamp": _days_ago_ts(178), "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(90), "original": "https://example.com/"},
+    ]
+    mock_fetch.return_value = SAMPLE_HTML
+
+    result = get_historical_snapshots("https://example.com/")
+
+    mock_list.assert_called_once()
+    kwargs = mock_list.call_args.kwargs
+    assert kwargs["from_ts"] == _days_ago_ts(195)[:8]
+    assert kwargs["to_ts"] == _days_ago_ts(15)[:8]
+    assert kwargs["limit"] == CDX_BATCH_LIMIT
+    assert kwargs["collapse"] == "timestamp:8"
+    # The 90-day capture is outside both windows, so ~30 days has no baseline
+    assert [(r["label"], r["timestamp"]) for r in result] == [("~180 days ago", _days_ago_ts(178))]
+
+
+def test_wayback_delta_rows_follow_rule_table_order():
+    current = {"title": "New", "framework_hints": ["React"], "has_pricing_keywords": True,
+               "html_bytes": 3000, "script_count": 12}
+    snapshots = [{"label": "~30 days ago", "timestamp": "20240105123000",
+                  "signals": {"title": None, "framework_hints": [], "html_bytes": 1000, "script_count": 2}}]
+    md = wayback_delta_to_markdown(current, snapshots)
+    body = md.split("### ~30 days ago (January 05, 2024)\n\n", 1)[1]
+    assert body == (
+        "- **Title changed**: \"(unknown)\" → \"New\"\n"
+        "- **Tech stack emerged** _(low-confidence)_: Now using React\n"
+        "- **Pricing emerged**: Now shows pricing/plans keywords\n"
+        "- **Page grew**: 1,000 → 3,000 bytes (+200%)\n"
+        "- **Script complexity**: 2 → 12 scripts\n"
+        "\n"
+    )
+
+
+def test_wayback_signals_same_from_lexbor_and_soup(monkeypatch):
+    """selectolax's lexbor path yields the same signals as the BeautifulSoup fallback."""
+    import utils.wayback as wayback
+
+    if wayback.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    tricky = SAMPLE_INSTITUTIONAL_HTML.replace(
+        "</body>",
+        "<div><p>  </p><span> Open\n  studio </span><p></p></div>"
+        "<section><h3>Our <b>Faculty</b></h3><script>var n = 'Hidden Person';</script>"
+        "<p>Ada Lovelace<!-- Not Counted --></p><noscript>Enable JS</noscript>"
+        "<style>.Some Rule {}</style></section>"
+        "<nav><a href='/a'>A</a><nav><a href='/b'>B</a></nav></nav>"
+        "<meta name='description' content></body>",
+    )
+    pages = [SAMPLE_HTML, SAMPLE_HTML_MINIMAL, SAMPLE_INSTITUTIONAL_HTML, tricky, ""]
+    lexbor = [wayback._extract_wayback_signals(page, len(page)) for page in pages]
+    monkeypatch.setattr(wayback, "LexborHTMLParser", None)
+    assert [wayback._extract_wayback_signals(page, len(page)) for page in pages] == lexbor
+
+
+@patch('utils.wayback.fetch_snapshot_html')
+@patch('utils.wayback.list_snapshots')
+def test_historical_snapshots_skip_older_fetch_when_recent_unchanged(mock_list, mock_fetch, monkeypatch):
+    """With current signals, the ~180 day snapshot is fetched only if ~30 days shows a change."""
+    import utils.wayback as wayback
+
+    mock_list.return_value = [
+        {"timestamp": _days_ago_ts(30), "original": "https://example.com/"},
+        {"timestamp": _days_ago_ts(180), "original": "https://example.com/"},
+    ]
+    mock_fetch.return_value = SAMPLE_HTML
+    current = extract_wayback_signals(SAMPLE_HTML)
+
+    result = get_historical_snapshots("https://example.com/", current)
+    assert [r["label"] for r in result] == ["~30 days ago"]
+    assert mock_fetch.call_count == 1
+
+    mock_fetch.reset_mock()
+    retitled = dict(current, title="Example Company - New Tagline")
+    result = get_historical_snapshots("https://example.com/", retitled)
+    assert [r["label"] for r in result] == ["~30 days ago", "~180 days ago"]
+    assert mock_fetch.call_count == 2
+
+    mock_fetch.reset_mock()
+    monkeypatch.setattr(wayback, "WAYBACK_ADAPTIVE", False)
+    result = get_historical_snapshots("https://example.com/", current)
+    assert [r["label"] for r in result] == ["~30 days ago", "~180 days ago"]
+
+
+def test_matches_current_ignores_changes_the_delta_would_not_report():
+    """Small size and script drift count as unchanged; a pricing flip does not."""
+    from utils.wayback import _matches_current
+
+    current = {"title": "Acme", "framework_hints": ["React"], "has_pricing_keywords": False,
+               "html_bytes": 10_000, "script_count": 10}
+    drifted = dict(current, framework_hints=["React"], html_bytes=12_000, script_count=13)
+    assert _matches_current(drifted, current)
+    assert not _matches_current(dict(current, has_pricing_keywords=True), current)
+
+
+def test_lexbor_structural_counts_match_soup_walk():
+    """The lexbor CSS counts agree with the BeautifulSoup traversal, nested navs included."""
+    import utils.wayback as wayback
+
+    if wayback.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    nested = (
+        "<nav><a href='/a'>A</a><nav><a href='/b'>B</a></nav></nav>"
+        "<footer><a href='/c'>C</a></footer><footer><a>D</a><a>E</a></footer>"
+        "<section><h2>x</h2><h3>y</h3><img src='i.png'></section><h4>z</h4>"
+    )
+    for page in [SAMPLE_HTML, SAMPLE_HTML_MINIMAL, SAMPLE_INSTITUTIONAL_HTML, nested]:
+        soup = BeautifulSoup(page, "lxml")
+        assert wayback._structural_counts_lexbor(wayback._parse_lexbor(page)) == wayback._extract_structural_signals(soup)
@@ -14,7 +14,7 @@ def safe_execute(default: T):
             try:
                 return fn(*args, **kwargs)
             except Exception as exc:  # noqa: BLE001
-                logger.error("safe_execute caught error in %s: %s", fn.__name__, exc)
+                logger.error("safe_execute caught error in {}: {}", fn.__name__, exc)
                 return default
         return wrapper
     return decorator
@@ -1,15 +1,74 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
-from typing import Any, Dict, Optional
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from loguru import logger
-
-try:
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # optional dependency
-    genai = None
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# NOTE: google-generativeai (and its grpc/protobuf tree) is imported lazily in
+# GeminiLLMClient.__init__, so the deterministic path never pays for it.
+
+
+def _is_retryable_gemini_error(exc: BaseException) -> bool:
+    """True for transient Gemini failures (429 / 503) worth retrying before falling back."""
+    try:
+        from google.api_core import exceptions as google_exceptions  # type: ignore
+    except ImportError:  # optional dependency
+        return False
+    return isinstance(
+        exc,
+        (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable),
+    )
+
+
+# One retry policy for every Gemini call: transient errors back off with
+# jitter; anything else (or the last attempt) re-raises to the caller.
+_gemini_retry = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(min=0.5, max=8),
+    retry=retry_if_exception(_is_retryable_gemini_error),
+    reraise=True,
+)
+
+
+# Planner focus vocabulary (matched against whole lowercase word tokens).
+_FOCUS_TOKEN_RE = re.compile(r"[a-z]+")
+REVIEWS_SET = frozenset(
+    {"review", "reviews", "brand", "branding", "reputation", "customer", "customers", "voice"}
+)
+SOCIAL_SET = frozenset({"social", "twitter", "instagram", "tiktok", "youtube", "community"})
+CAREERS_SET = frozenset(
+    {
+        "hiring",
+        "hire",
+        "hires",
+        "recruit",
+        "recruiting",
+        "recruitment",
+        "talent",
+        "headcount",
+        "org",
+        "organization",
+        "organizational",
+        "team",
+        "teams",
+    }
+)
+ADS_SET = frozenset(
+    {"ads", "advertising", "campaign", "campaigns", "cpc", "paid", "growth", "marketing"}
+)
 
 
 class LLMClient:
@@ -81,51 +140,24 @@ class LLMClient:
             plan = self._empty_plan()
 
         # --- Focus heuristics -------------------------------------------------
-        if text:
+        # Whole-word matching: "teamwork" must not trigger the "team" rule.
+        tokens = set(_FOCUS_TOKEN_RE.findall(text))
+        if tokens:
             # Reviews / brand / reputation => reviews + social
-            if any(
-                word in text
-                for word in ["review", "reviews", "brand", "reputation", "customer", "voice"]
-            ):
+            if tokens & REVIEWS_SET:
                 plan["use_reviews_snapshot"] = True
                 plan["use_social_snapshot"] = True
 
             # Explicit social mentions => social
-            if any(
-                word in text
-                for word in ["social", "twitter", "instagram", "tiktok", "youtube", "community"]
-            ):
+            if tokens & SOCIAL_SET:
                 plan["use_social_snapshot"] = True
 
             # Hiring / org / team => careers intel
-            if any(
-                word in text
-                for word in [
-                    "hiring",
-                    "hire",
-                    "recruit",
-                    "talent",
-                    "headcount",
-                    "org",
-                    "organization",
-                    "team",
-                ]
-            ):
+            if tokens & CAREERS_SET:
                 plan["use_careers_intel"] = True
 
             # Ads / paid / growth / marketing => ads snapshot
-            if any(
-                word in text
-                for word in [
-                    "ads",
-                    "advertising",
-                    "campaign",
-                    "cpc",
-                    "paid",
-                    "growth",
-                    "marketing",
-                ]
-            ):
+            if tokens & ADS_SET:
                 plan["use_ads_snapshot"] = True
 
         return plan
@@ -200,6 +232,20 @@ class LLMClient:
             f"{body}"
         )
 
+    def synthesize_report_stream(
+        self,
+        profile_dict: Dict[str, Any],
+        focus: Optional[str],
+        delta_context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming interface for report synthesis.
+
+        The deterministic report is produced in one piece, so it is yielded as a
+        single chunk; LLM-backed subclasses yield chunks as they are generated.
+        """
+        yield self.synthesize_report(profile_dict, focus, delta_context=delta_context)
+
     # ------------------------------------------------------------------ #
     # Internal helpers for different styles
     # ------------------------------------------------------------------ #
@@ -446,6 +492,14 @@ class LLMClient:
 
 from core.analyst_prompts import PLANNING_PROMPT, SYNTHESIS_PROMPT
 
+# One-line plan example for planner prompts (the pretty-printed version cost
+# ~100 input tokens per call for no gain).
+_PLAN_JSON_EXAMPLE = (
+    'Example: {"use_web_scrape":true,"use_seo_probe":true,"use_tech_stack":true,'
+    '"use_reviews_snapshot":false,"use_social_snapshot":false,'
+    '"use_careers_intel":true,"use_ads_snapshot":false}'
+)
+
 
 class GeminiLLMClient(LLMClient):
     """
@@ -457,23 +511,49 @@ class GeminiLLMClient(LLMClient):
     - Otherwise, use Gemini for:
         * plan_tools(...)        -> JSON tool plan
         * synthesize_report(...) -> Markdown report
+
+    Environment variables:
+    - GEMINI_PLANNING_MODEL: planner model (default: gemini-2.5-flash-lite; the
+      plan is 7 booleans, so a lite model is sufficient)
+    - GEMINI_SYNTHESIS_MODEL: report model (default: gemini-2.5-flash)
+    - GEMINI_TEMPERATURE: sampling temperature (default: 0.1)
     """
 
     def __init__(self) -> None:
         super().__init__()
 
+        # In-flight Gemini calls keyed by prompt hash, so concurrent identical
+        # requests share one API call instead of each issuing their own.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # GenerativeModel handles are reused across calls; _ready is set once
+        # the background warm-up has created them (or immediately if disabled).
+        self._models: Dict[str, Any] = {}
+        self._ready = threading.Event()
+
         raw_flag = os.getenv("USE_GEMINI_LLM", "0")
         api_key = os.getenv("GOOGLE_API_KEY")
 
-        logger.info(
-            "GeminiLLMClient INIT DEBUG: raw_flag=%r, api_key_set=%r, genai_imported=%r",
+        use_gemini = raw_flag in {"1", "true", "True"}
+
+        # Only import the SDK when it could actually be used.
+        self._genai: Any = None
+        if use_gemini and api_key:
+            try:
+                import google.generativeai as genai  # type: ignore
+                self._genai = genai
+            except ImportError:  # optional dependency
+                pass
+
+        logger.debug(
+            "GeminiLLMClient INIT: raw_flag={!r}, api_key_set={}, genai_imported={}",
             raw_flag,
             bool(api_key),
-            genai is not None,
+            self._genai is not None,
         )
 
-        use_gemini = raw_flag in {"1", "true", "True"}
-        self._enabled = bool(use_gemini and api_key and genai is not None)
+        self._enabled = bool(use_gemini and api_key and self._genai is not None)
 
         if not self._enabled:
             # Soft failure: keep deterministic behavior
@@ -487,16 +567,17 @@ class GeminiLLMClient(LLMClient):
                     "GeminiLLMClient: GOOGLE_API_KEY not set; "
                     "falling back to deterministic LLMClient."
                 )
-            elif genai is None:
+            elif self._genai is None:
                 logger.warning(
                     "GeminiLLMClient: google-generativeai not installed; "
                     "falling back to deterministic LLMClient."
                 )
+            self._ready.set()
             return
 
-        genai.configure(api_key=api_key)
+        self._genai.configure(api_key=api_key)
 
-        self.plan_model_name = os.getenv("GEMINI_PLANNING_MODEL", "gemini-2.5-flash")
+        self.plan_model_name = os.getenv("GEMINI_PLANNING_MODEL", "gemini-2.5-flash-lite")
         self.synth_model_name = os.getenv("GEMINI_SYNTHESIS_MODEL", "gemini-2.5-flash")
         try:
             self.temperature = float(os.getenv("GEMINI_TEMPERATURE", "0.1"))
@@ -508,6 +589,102 @@ class GeminiLLMClient(LLMClient):
             f"synthesis={self.synth_model_name}, temperature={self.temperature}"
         )
 
+        threading.Thread(
+            target=self._warmup, name="gemini-warmup", daemon=True
+        ).start()
+
+    # ------------------------------------------------------------------ #
+    # Gemini call (shared by planning + synthesis)
+    # ------------------------------------------------------------------ #
+
+    def _model(self, model_name: str) -> Any:
+        """Return a cached GenerativeModel handle for model_name."""
+        model = self._models.get(model_name)
+        if model is None:
+            model = self._genai.GenerativeModel(model_name)
+            self._models[model_name] = model
+        return model
+
+    def _warmup(self) -> None:
+        """
+        Create model handles and open the API connection off the request path,
+        so the first plan_tools call does not pay for the handshake.
+        """
+        try:
+            plan_model = self._model(self.plan_model_name)
+            self._model(self.synth_model_name)
+            plan_model.count_tokens("warmup")
+        except Exception as e:  # pragma: no cover - network/LLM failure
+            logger.debug("GeminiLLMClient warm-up failed: {}", e)
+        finally:
+            self._ready.set()
+
+    @_gemini_retry
+    def _generate(self, model_name: str, prompt: str) -> str:
+        """
+        Run a single Gemini generation and return the stripped text.
+
+        Rate-limit / unavailable errors are retried with jittered exponential
+        backoff; anything else (or the final failed attempt) is re-raised so
+        callers can fall back to the deterministic path.
+        """
+        model = self._model(model_name)
+        resp = model.generate_content(
+            prompt,
+            generation_config={"temperature": self.temperature},
+        )
+        return (resp.text or "").strip()
+
+    @staticmethod
+    def _prompt_key(model_name: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _coalesced(self, key: str, fn: Callable[[], str]) -> str:
+        """
+        Run fn() once per key across concurrent callers.
+
+        The first caller for a key does the work; callers arriving while it is
+        in flight block on the same Future and receive its result (or error).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    @_gemini_retry
+    def _open_stream(self, model_name: str, prompt: str) -> Any:
+        """Open a streaming Gemini generation (retried like _generate)."""
+        model = self._model(model_name)
+        return model.generate_content(
+            prompt,
+            generation_config={"temperature": self.temperature},
+            stream=True,
+        )
+
+    def _generate_stream(self, model_name: str, prompt: str) -> Iterator[str]:
+        """Yield text chunks from a streaming Gemini generation."""
+        for chunk in self._open_stream(model_name, prompt):
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
+
     # ------------------------------------------------------------------ #
     # Planning
     # ------------------------------------------------------------------ #
@@ -526,40 +703,24 @@ class GeminiLLMClient(LLMClient):
         if not company_url and not (focus or "").strip():
             return self._empty_plan()
 
+        # Give an in-progress warm-up a brief chance to finish; never block long.
+        self._ready.wait(timeout=0.5)
+
         prompt = (
-            f"{PLANNING_PROMPT}\n\n"
-            "You are the planning LLM for Micro-Analyst.\n"
+            f"{PLANNING_PROMPT}\n"
             "Decide which MCP tools to call for this analysis.\n\n"
             f"Company name: {company_name or 'Unknown'}\n"
             f"Company URL: {company_url or 'None'}\n"
             f"User focus / priorities: {focus or 'None provided'}\n\n"
-            "Return ONLY a JSON object with these boolean keys:\n"
-            "  use_web_scrape,\n"
-            "  use_seo_probe,\n"
-            "  use_tech_stack,\n"
-            "  use_reviews_snapshot,\n"
-            "  use_social_snapshot,\n"
-            "  use_careers_intel,\n"
-            "  use_ads_snapshot.\n"
-            "Example:\n"
-            "{\n"
-            '  "use_web_scrape": true,\n'
-            '  "use_seo_probe": true,\n'
-            '  "use_tech_stack": true,\n'
-            '  "use_reviews_snapshot": false,\n'
-            '  "use_social_snapshot": false,\n'
-            '  "use_careers_intel": true,\n'
-            '  "use_ads_snapshot": false\n'
-            "}\n"
+            "Return ONLY a JSON object with exactly these seven boolean keys.\n"
+            f"{_PLAN_JSON_EXAMPLE}\n"
         )
 
         try:
-            model = genai.GenerativeModel(self.plan_model_name)
-            resp = model.generate_content(
-                prompt,
-                generation_config={"temperature": self.temperature},
+            text = self._coalesced(
+                self._prompt_key(self.plan_model_name, prompt),
+                lambda: self._generate(self.plan_model_name, prompt),
             )
-            text = (resp.text or "").strip()
         except Exception as e:  # pragma: no cover - network/LLM failure
             logger.error(f"GeminiLLMClient.plan_tools: LLM error: {e}")
             return super().plan_tools(company_name, company_url, focus)
@@ -621,11 +782,59 @@ class GeminiLLMClient(LLMClient):
         - investor_brief  → punchy, metrics-forward
         - founder_playbook→ actionable strategy blueprint
         """
+        try:
+            return "".join(
+                self.synthesize_report_stream(profile_dict, focus, delta_context)
+            ).strip()
+        except Exception:
+            # The stream already logged the error; a cut-off report is not returned
+            return super().synthesize_report(profile_dict, focus, delta_context)
 
+    def synthesize_report_stream(
+        self,
+        profile_dict: Dict[str, Any],
+        focus: Optional[str],
+        delta_context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of synthesize_report: yields Gemini chunks as they arrive.
+
+        Falls back to the deterministic report (as a single chunk) when Gemini is
+        disabled, errors before producing output, or returns nothing. An error
+        after partial output is re-raised so consumers don't mistake the
+        partial text for a complete report.
+        """
         # If Gemini isn't enabled, fallback to deterministic
         if not self._enabled:
-            return super().synthesize_report(profile_dict, focus, delta_context)
+            yield super().synthesize_report(profile_dict, focus, delta_context)
+            return
+
+        prompt = self._build_synthesis_prompt(profile_dict, focus, delta_context)
 
+        emitted = False
+        try:
+            for chunk in self._generate_stream(self.synth_model_name, prompt):
+                if chunk:
+                    emitted = True
+                    yield chunk
+        except Exception as e:
+            logger.error(f"GeminiLLMClient.synthesize_report: LLM error: {e}")
+            if emitted:
+                raise
+            yield super().synthesize_report(profile_dict, focus, delta_context)
+            return
+
+        if not emitted:
+            logger.warning("Empty LLM response; falling back to deterministic.")
+            yield super().synthesize_report(profile_dict, focus, delta_context)
+
+    def _build_synthesis_prompt(
+        self,
+        profile_dict: Dict[str, Any],
+        focus: Optional[str],
+        delta_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the voice-specific Gemini synthesis prompt."""
         # --- Detect voice ---
         style = "standard"
         lf = (focus or "").lower()
@@ -747,23 +956,7 @@ If "Strategic Trajectory" data is present (delta_context), you MUST start the re
 >     *   [CRITICAL/WARNING/INFO] [Signal Description]
 If NO "Strategic Trajectory" data is present, omit this section entirely.
 """
-
-        try:
-            model = genai.GenerativeModel(self.synth_model_name)
-            resp = model.generate_content(
-                prompt,
-                generation_config={"temperature": self.temperature},
-            )
-            text = (resp.text or "").strip()
-        except Exception as e:
-            logger.error(f"GeminiLLMClient.synthesize_report: LLM error: {e}")
-            return super().synthesize_report(profile_dict, focus)
-
-        if not text:
-            logger.warning("Empty LLM response; falling back to deterministic.")
-            return super().synthesize_report(profile_dict, focus)
-
-        return text
+        return prompt
 
 
 class OllamaLLMClient(LLMClient):
@@ -843,24 +1036,8 @@ class OllamaLLMClient(LLMClient):
             f"Company name: {company_name or 'Unknown'}\n"
             f"Company URL: {company_url or 'None'}\n"
             f"User focus / priorities: {focus or 'None provided'}\n\n"
-            "Return ONLY a JSON object with these boolean keys:\n"
-            "  use_web_scrape,\n"
-            "  use_seo_probe,\n"
-            "  use_tech_stack,\n"
-            "  use_reviews_snapshot,\n"
-            "  use_social_snapshot,\n"
-            "  use_careers_intel,\n"
-            "  use_ads_snapshot.\n"
-            "Example:\n"
-            "{\n"
-            '  "use_web_scrape": true,\n'
-            '  "use_seo_probe": true,\n'
-            '  "use_tech_stack": true,\n'
-            '  "use_reviews_snapshot": false,\n'
-            '  "use_social_snapshot": false,\n'
-            '  "use_careers_intel": true,\n'
-            '  "use_ads_snapshot": false\n'
-            "}\n"
+            "Return ONLY a JSON object with exactly these seven boolean keys.\n"
+            f"{_PLAN_JSON_EXAMPLE}\n"
             "Return ONLY the JSON, no other text."
         )
         
@@ -876,7 +1053,13 @@ class OllamaLLMClient(LLMClient):
         
         return plan
     
-    def synthesize_report(self, profile_dict: Dict[str, Any], focus: Optional[str]) -> str:
+    def synthesize_report(
+        self,
+        profile_dict: Dict[str, Any],
+        focus: Optional[str],
+        delta_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        # delta_context is accepted for interface parity but not sent to Ollama.
         if not self._enabled:
             return super().synthesize_report(profile_dict, focus)
         
@@ -964,6 +1147,7 @@ Generate the report now:
         return text.strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm_client() -> LLMClient:
     """
     Factory: returns the appropriate LLM client based on environment configuration.
@@ -974,6 +1158,9 @@ def get_llm_client() -> LLMClient:
     3. Neither -> base deterministic LLMClient
     
     This prioritizes local Ollama to avoid accidental API costs during development.
+
+    The client is a process-wide singleton: environment is read once on first
+    call. Use get_llm_client.cache_clear() to pick up changed configuration.
     """
     # Check Ollama first (local, free)
     if os.getenv("USE_OLLAMA_LLM", "0") in {"1", "true", "True"}: